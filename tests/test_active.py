@@ -8,6 +8,10 @@ try:
     import matplotlib.pyplot as plt
 except ImportError:
     plt = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 
 class TestActive(TestBase):
@@ -74,6 +78,21 @@ class TestView(TestBase):
         self.assertEqual(xw.books.count, n_books)
         self.assertEqual(xw.books[0].sheets[0].range('A1:C1').value, [1., 2., 3.])
 
+    @unittest.skipIf(pd is None, 'pandas missing')
+    def test_dataframe_table_with_empty_row(self):
+        sheet = self.wb1.sheets[0]
+        df = pd.DataFrame([[1., 2.], [float('nan'), float('nan')], [5., 6.]], columns=['a', 'b'])
+        xw.view(df, sheet=sheet)
+        self.assertEqual(sheet.tables[0].range.address, '$A$1:$C$4')
+
+    @unittest.skipIf(pd is None, 'pandas missing')
+    def test_dataframe_table_with_multiindex(self):
+        sheet = self.wb1.sheets[0]
+        df = pd.DataFrame([[1., 2.], [float('nan'), float('nan')], [5., 6.]], columns=['a', 'b'],
+                          index=pd.MultiIndex.from_tuples([('x', 1), ('x', 2), ('y', 1)], names=['i1', 'i2']))
+        xw.view(df, sheet=sheet)
+        self.assertEqual(sheet.tables[0].range.address, '$A$1:$D$4')
+
 
 if __name__ == '__main__':
     unittest.main()
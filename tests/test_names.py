@@ -55,6 +55,18 @@ class TestNames(TestBase):
         self.wb1.names['to_be_deleted'].delete()
         self.assertIsNone(self.wb1.sheets[0].range('B10:C11').name)
 
+    def test_delete_missing_named_item(self):
+        with self.assertRaises(KeyError):
+            del self.wb1.names['does_not_exist']
+
+    def test_delete_missing_named_item_index(self):
+        self.wb1.sheets[0].range('B10:C11').name = 'to_be_kept'
+        with self.assertRaises(KeyError):
+            del self.wb1.names[1]
+        with self.assertRaises(KeyError):
+            del self.wb1.names[100]
+        self.assertEqual(len(self.wb1.names), 1)
+
     def test_delete_named_item3(self):
         self.wb1.sheets[0].range('B10:C11').name = 'to_be_deleted'
         self.assertEqual(self.wb1.sheets[0].range('to_be_deleted').name.name, 'to_be_deleted')
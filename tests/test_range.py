@@ -256,6 +256,21 @@ class TestRangeAttributes(TestBase):
         res = wb1.sheets[0].range((1, 1), (3, 3)).get_address(external=True)
         self.assertEqual(res, "'[test book.xlsx]Sheet1'!$A$1:$C$3")
 
+    def test_get_address_after_sheet_rename(self):
+        rng = self.wb1.sheets[0].range('A1:B2')
+        self.assertEqual(rng.get_address(), '$A$1:$B$2')
+        rng.get_address(include_sheetname=True)
+        self.wb1.sheets[0].name = 'renamed'
+        self.assertEqual(rng.get_address(include_sheetname=True), "'renamed'!$A$1:$B$2")
+        self.assertEqual(rng.get_address(), '$A$1:$B$2')
+
+    def test_get_address_after_insert(self):
+        sht = self.wb1.sheets[0]
+        rng = sht['A2']
+        self.assertEqual(rng.get_address(), '$A$2')
+        sht['A1'].insert('down')
+        self.assertEqual(rng.get_address(), rng.address)
+
     def test_address(self):
         self.assertEqual(self.wb1.sheets[0].range('A1:B2').address, '$A$1:$B$2')
 
@@ -767,6 +782,41 @@ class TestRangeExpansion(TestBase):
 
         self.assertEqual(rng.options(expand='right').value, [['a'] * 3] * 5)
 
+    def test_beyond_probed_cells(self):
+        sht = self.wb1.sheets[0]
+        sht['A1'].value = [['a'] * 12] * 15
+
+        self.assertEqual(sht['A1'].expand('table').shape, (15, 12))
+        self.assertEqual(sht['A1'].expand('down').shape, (15, 1))
+        self.assertEqual(sht['A1'].expand('right').shape, (1, 12))
+
+    def test_empty_string_formula(self):
+        sht = self.wb1.sheets[0]
+        sht['A1'].value = [[1], [2], [3], [None], [5]]
+        sht['A4'].formula = '=""'
+        self.assertEqual(sht['A1'].expand('down').address, '$A$1:$A$5')
+
+        sht['C1'].value = 1
+        sht['C2'].formula = '=""'
+        self.assertEqual(sht['C1'].expand('down').address, '$C$1')
+
+    def test_array(self):
+        sht = self.wb1.sheets[0]
+        sht['A1'].value = [[1, 2], [3, 4]]
+        sht['D1:E2'].formula_array = '=A1:B2'
+        self.assertEqual(sht['D1'].expand('table').address, '$D$1:$E$2')
+
+    def test_edge_of_sheet(self):
+        sht = self.wb1.sheets[0]
+        sht['A1048570'].value = [[1]] * 7
+        self.assertEqual(sht['A1048570'].expand('down').address, '$A$1048570:$A$1048576')
+
+        sht['XFA1'].value = [[1] * 4]
+        self.assertEqual(sht['XFA1'].expand('right').address, '$XFA$1:$XFD$1')
+
+        sht['XFD1048576'].value = 1
+        self.assertEqual(sht['XFD1048576'].expand('table').address, '$XFD$1048576')
+
     def test_copy_picture(self):
         rng = self.wb1.sheets[0]['A1:B2']
         rng.copy_picture()
@@ -203,6 +203,14 @@ class TestPicture(TestBase):
         for ix, pic in enumerate(self.wb1.sheets[0].pictures):
             self.assertEqual(self.wb1.sheets[0].pictures[ix].name, names[ix])
 
+    def test_delete_while_iterating(self):
+        filename = os.path.join(this_dir, 'sample_picture.png')
+        for name in ['pic1', 'pic2', 'pic3']:
+            self.wb1.sheets[0].pictures.add(filename, name=name)
+        for pic in self.wb1.sheets[0].pictures:
+            pic.delete()
+        self.assertEqual(len(self.wb1.sheets[0].pictures), 0)
+
     def test_contains(self):
         filename = os.path.join(this_dir, 'sample_picture.png')
         pic1 = self.wb1.sheets[0].pictures.add(filename, name='pic 1')
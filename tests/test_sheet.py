@@ -25,6 +25,12 @@ class TestSheets(TestBase):
         for ix, sht in enumerate(self.wb1.sheets):
             self.assertEqual(self.wb1.sheets[ix].name, sht.name)
 
+    def test_delete_while_iterating(self):
+        for sht in self.wb1.sheets:
+            if sht.name != 'Sheet1':
+                sht.delete()
+        self.assertEqual([sht.name for sht in self.wb1.sheets], ['Sheet1'])
+
     def test_add(self):
         self.wb1.sheets.add()
         self.assertEqual(len(self.wb1.sheets), 4)
@@ -53,6 +59,24 @@ class TestSheets(TestBase):
         with self.assertRaises(Exception):
             self.wb1.sheets.add('Sheet1')
 
+    def test_add_many(self):
+        new_sheets = self.wb1.sheets.add_many(['a', 'b'], after=len(self.wb1.sheets))
+        self.assertEqual([sheet.name for sheet in new_sheets], ['a', 'b'])
+        self.assertEqual(self.wb1.sheets[-1].name, 'b')
+        self.assertEqual(self.wb1.sheets[-2].name, 'a')
+
+    def test_add_many_before(self):
+        self.wb1.sheets.add_many(['a', 'b'], before='Sheet1')
+        self.assertEqual([sheet.name for sheet in self.wb1.sheets][:3], ['a', 'b', 'Sheet1'])
+
+    def test_add_many_name_already_taken(self):
+        with self.assertRaises(ValueError):
+            self.wb1.sheets.add_many(['a', 'SHEET1'])
+        with self.assertRaises(ValueError):
+            self.wb1.sheets.add_many(['b', 'B'])
+        self.assertEqual(len(self.wb1.sheets), 3)
+        self.assertNotIn('a', [sheet.name for sheet in self.wb1.sheets])
+
 
 class TestSheet(TestBase):
     def test_name(self):
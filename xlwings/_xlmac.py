@@ -25,10 +25,6 @@ try:
     import numpy as np
 except ImportError:
     np = None
-try:
-    from PIL import ImageGrab
-except ImportError:
-    PIL = None
 
 USER_CONFIG_FILE = os.path.join(os.path.expanduser("~"), 'Library', 'Containers',
                                 'com.microsoft.Excel', 'Data', 'xlwings.conf')
@@ -76,6 +72,8 @@ class App:
             self.xl = appscript.app(pid=xl, terms=mac_dict)
         else:
             self.xl = xl
+        # The version doesn't change while the app is running
+        self._version = None
 
     @property
     def api(self):
@@ -89,7 +87,9 @@ class App:
 
     @property
     def version(self):
-        return self.xl.version.get()
+        if self._version is None:
+            self._version = self.xl.version.get()
+        return self._version
 
     @property
     def selection(self):
@@ -376,8 +376,9 @@ class Sheets:
         return self.workbook.xl.count(each=kw.worksheet)
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self(i + 1)
+        # The names are read up front so that deleting sheets while iterating doesn't shift the remaining ones
+        for name in self.workbook.xl.worksheets.name.get():
+            yield Sheet(self.workbook, name)
 
     def add(self, before=None, after=None):
         if before is None and after is None:
@@ -542,6 +543,8 @@ class Sheet:
 
 class Range:
 
+    __slots__ = ['sheet', 'xl', '_coords']
+
     def __init__(self, sheet, address):
         self.sheet = sheet
         if isinstance(address, tuple):
@@ -915,6 +918,8 @@ class Range:
                              format=_format[format])
 
     def to_png(self, path):
+        # Pillow is only needed here and therefore imported on first use
+        from PIL import ImageGrab
         self.copy_picture(appearance='screen', format='bitmap')
         im = ImageGrab.grabclipboard()
         im.save(path)
@@ -1169,8 +1174,12 @@ class Collection:
         return self.parent.xl.count(each=self._kw)
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self(i + 1)
+        # The names are read up front so that deleting items while iterating doesn't shift the remaining ones.
+        # Names don't have to be unique (e.g. copied shapes), in which case the indices are used instead
+        names = self.xl.name.get()
+        keys = names if len(set(names)) == len(names) else range(1, len(names) + 1)
+        for key in keys:
+            yield self._wrap(self.parent, key)
 
     def __contains__(self, key):
         return self.xl[key].exists()
@@ -1531,12 +1540,13 @@ class Pictures(Collection):
 
     def add(self, filename, link_to_file, save_with_document, left, top, width, height):
 
-        version = VersionNumber(self.parent.book.app.version)
+        sandboxed = not link_to_file and VersionNumber(self.parent.book.app.version) >= 15
 
-        if not link_to_file and version >= 15:
+        if sandboxed:
             # Office 2016 for Mac is sandboxed. This path seems to work without the need of granting access explicitly
             xlwings_picture = os.path.expanduser("~") + '/Library/Containers/com.microsoft.Excel/Data/xlwings_picture.png'
-            shutil.copy2(filename, xlwings_picture)
+            # Only the content is needed as the copy is removed again once Excel has loaded it
+            shutil.copyfile(filename, xlwings_picture)
             filename = xlwings_picture
 
         sheet_index = self.parent.xl.entry_index.get()
@@ -1562,7 +1572,7 @@ class Pictures(Collection):
         picture.top = top
         picture.left = left
 
-        if not link_to_file and version >= 15:
+        if sandboxed:
             os.remove(filename)
 
         return picture
@@ -1576,13 +1586,18 @@ class Names:
     def __call__(self, name_or_index):
         return Name(self.parent, xl=self.xl[name_or_index])
 
-    def contains(self, name_or_index):
+    def get(self, name_or_index):
+        # Returns None instead of raising if there's no such name
+        xl = self.xl[name_or_index]
         try:
-            self.xl[name_or_index].get()
+            xl.get()
         except appscript.reference.CommandError as e:
             # TODO: make more specific
-            return False
-        return True
+            return None
+        return Name(self.parent, xl=xl)
+
+    def contains(self, name_or_index):
+        return self.get(name_or_index) is not None
 
     def __len__(self):
         named_items = self.xl.get()
@@ -1591,6 +1606,13 @@ class Names:
         else:
             return len(named_items)
 
+    def __iter__(self):
+        # Gets the references to all named items in a single call instead of one call per index
+        named_items = self.xl.get()
+        if named_items != kw.missing_value:
+            for xl in named_items:
+                yield Name(self.parent, xl=xl)
+
     def add(self, name, refers_to):
         return Name(self.parent, self.parent.xl.make(at=self.parent.xl,
                                                      new=kw.named_item,
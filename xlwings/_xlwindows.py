@@ -23,7 +23,7 @@ import ctypes
 from ctypes import oledll, PyDLL, py_object, byref, windll
 
 import pythoncom
-from win32com.client import Dispatch, CoClassBaseClass, CDispatch, DispatchEx, DispatchBaseClass
+from win32com.client import Dispatch, CoClassBaseClass, CDispatch, DispatchEx, DispatchBaseClass, gencache
 import win32timezone
 import win32gui
 import win32process
@@ -41,10 +41,6 @@ try:
     import numpy as np
 except ImportError:
     np = None
-try:
-    from PIL import ImageGrab
-except ImportError:
-    PIL = None
 
 
 time_types = (dt.date, dt.datetime, pywintypes.TimeType)
@@ -53,11 +49,24 @@ if np:
 
 
 N_COM_ATTEMPTS = 0      # 0 means try indefinitely
+# If True, the Excel objects are early-bound, i.e. the COM calls go directly to the known DISPIDs instead of looking
+# them up by name first. The Python wrappers for Excel's type library are generated once under %TEMP%\gen_py
+USE_EARLY_BINDING = False
 BOOK_CALLER = None
 USER_CONFIG_FILE = os.path.join(os.path.expanduser("~"), '.xlwings', 'xlwings.conf')
 missing = object()
 
 
+def ensure_dispatch(xl):
+    if not USE_EARLY_BINDING:
+        return xl
+    try:
+        return gencache.EnsureDispatch(xl)
+    except Exception:
+        # e.g. if the wrappers can't be generated: fall back to late binding
+        return xl
+
+
 class COMRetryMethodWrapper:
 
     def __init__(self, method):
@@ -90,7 +99,7 @@ class COMRetryMethodWrapper:
 
 class ExcelBusyError(Exception):
     def __init__(self):
-        super(ExcelBusyError, self).__init__("Excel application is not responding")
+        super().__init__("Excel application is not responding")
 
 
 class COMRetryObjectWrapper:
@@ -239,7 +248,7 @@ def get_xl_app_from_hwnd(hwnd):
 
     ptr = accessible_object_from_window(child_hwnd)
     p = _PyCom_PyObjectFromIUnknown(ptr, byref(_IDISPATCH_GUID), True)
-    disp = COMRetryObjectWrapper(Dispatch(p))
+    disp = COMRetryObjectWrapper(ensure_dispatch(Dispatch(p)))
     return disp.Application
 
 
@@ -314,7 +323,7 @@ class App:
             warn('spec is ignored on Windows.')
         if xl is None:
             # new instance
-            self._xl = COMRetryObjectWrapper(DispatchEx('Excel.Application'))
+            self._xl = COMRetryObjectWrapper(ensure_dispatch(DispatchEx('Excel.Application')))
             if add_book:
                 self._xl.Workbooks.Add()
             self._hwnd = None
@@ -776,6 +785,8 @@ class Sheet:
 
 class Range:
 
+    __slots__ = ['_coords', '_xl']
+
     def __init__(self, xl):
         if isinstance(xl, tuple):
             self._coords = xl
@@ -1155,6 +1166,8 @@ class Range:
                             Format=_format[format])
 
     def to_png(self, path):
+        # Pillow is only needed here and therefore imported on first use
+        from PIL import ImageGrab
         max_retries = 10
         for retry in range(max_retries):
             # https://stackoverflow.com/questions/24740062/copypicture-method-of-range-class-failed-sometimes
@@ -1937,19 +1950,26 @@ class Names:
     def __call__(self, name_or_index):
         return Name(xl=self.xl(name_or_index))
 
-    def contains(self, name_or_index):
+    def get(self, name_or_index):
+        # Returns None instead of raising if there's no such name
         try:
-            self.xl(name_or_index)
+            return Name(xl=self.xl(name_or_index))
         except pywintypes.com_error as e:
             if e.hresult == -2147352567:
-                return False
+                return None
             else:
                 raise
-        return True
+
+    def contains(self, name_or_index):
+        return self.get(name_or_index) is not None
 
     def __len__(self):
         return self.xl.Count
 
+    def __iter__(self):
+        for xl in self.xl:
+            yield Name(xl=xl)
+
     def add(self, name, refers_to):
         return Name(xl=self.xl.Add(name, refers_to))
 
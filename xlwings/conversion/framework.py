@@ -13,7 +13,7 @@ class ConversionContext:
 class Options(dict):
 
     def __init__(self, original):
-        super(Options, self).__init__(original)
+        super().__init__(original)
 
     def override(self, **overrides):
         self.update(overrides)
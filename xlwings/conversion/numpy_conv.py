@@ -20,7 +20,7 @@ if np:
         @classmethod
         def base_reader(cls, options):
             return (
-                super(NumpyArrayConverter, cls).base_reader(
+                super().base_reader(
                     Options(options)
                     .defaults(empty=np.nan)
                 )
@@ -61,7 +61,7 @@ if pd:
         @classmethod
         def base_reader(cls, options):
             return (
-                super(PandasDataFrameConverter, cls).base_reader(
+                super().base_reader(
                     Options(options)
                     .override(ndim=2)
                 )
@@ -264,7 +264,7 @@ class DictConverter(Converter):
     @classmethod
     def base_reader(cls, options):
         return (
-            super(DictConverter, cls).base_reader(
+            super().base_reader(
                 Options(options)
                 .override(ndim=2)
             )
@@ -290,7 +290,7 @@ class OrderedDictConverter(Converter):
     @classmethod
     def base_reader(cls, options):
         return (
-            super(OrderedDictConverter, cls).base_reader(
+            super().base_reader(
                 Options(options)
                 .override(ndim=2)
             )
@@ -1,9 +1,56 @@
-from .main import Range
-
 expanders = {}
 
 _empty = (None, '')
 
+# Number of cells that are read in one go from the origin downwards/rightwards to find the end of a region
+_PROBE_SIZE = 10
+
+# Smallest sheet size across the supported file formats (xls): blocks within these limits can't cross the edge
+_MIN_SHEET_ROWS = 65536
+_MIN_SHEET_COLUMNS = 256
+
+
+def _probe(sheet, row, column, nrows, ncols):
+    """
+    Reads the raw values of a block of up to nrows x ncols cells in a single call instead of one call per cell.
+    The block is cut off at the edge of the sheet. Returns the values as a list of rows and whether the block
+    reaches the last row and the last column of the sheet.
+    """
+    at_bottom = at_right = False
+    if row + nrows - 1 >= _MIN_SHEET_ROWS or column + ncols - 1 >= _MIN_SHEET_COLUMNS:
+        sheet_rows, sheet_columns = sheet.cells.shape
+        nrows = min(nrows, sheet_rows - row + 1)
+        ncols = min(ncols, sheet_columns - column + 1)
+        at_bottom = row + nrows - 1 == sheet_rows
+        at_right = column + ncols - 1 == sheet_columns
+    values = sheet.range((row, column, nrows, ncols)).raw_value
+    if nrows == 1 and ncols == 1:
+        # A single cell is delivered as a scalar
+        values = [[values]]
+    return values, at_bottom, at_right
+
+
+def _last_index(cells, at_edge=False):
+    """
+    Returns the 0-based index of the last cell of a region given the probed cells (starting with the origin),
+    or None if the end of the region can't be determined from the probed cells and Range.end() is required.
+    at_edge tells whether the last probed cell is at the edge of the sheet.
+    """
+    n = len(cells)
+    if n > 1 and cells[1] in _empty:
+        return 0
+    if n > 2 and cells[2] in _empty:
+        return 1
+    # From here on, this mimics Range.end(): only truly blank cells end the region. As '' can also be a formula
+    # returning an empty string (and blank cells are delivered as '' on macOS), it's left to Range.end()
+    for i in range(3, n):
+        if cells[i] is None:
+            return i - 1
+        if cells[i] == '':
+            return None
+    # No blank cell up to the edge of the sheet: the region ends there
+    return n - 1 if at_edge else None
+
 
 class Expander:
 
@@ -31,27 +78,29 @@ class Expander:
 class TableExpander(Expander):
 
     def expand(self, rng):
-        origin = rng(1, 1)
+        sheet = rng.sheet
+        row, column = rng.row, rng.column
+        origin = sheet.range((row, column))
 
         if origin.has_array:
-            bottom_left = origin.end('down')
-        elif origin(2, 1).raw_value in _empty:
-            bottom_left = origin
-        elif origin(3, 1).raw_value in _empty:
-            bottom_left = origin(2, 1)
+            last_row = origin.end('down').row
+            last_column = origin.end('right').column
         else:
-            bottom_left = origin(2, 1).end('down')
+            values, at_bottom, at_right = _probe(sheet, row, column, _PROBE_SIZE, _PROBE_SIZE)
 
-        if origin.has_array:
-            top_right = origin.end('right')
-        elif origin(1, 2).raw_value in _empty:
-            top_right = origin
-        elif origin(1, 3).raw_value in _empty:
-            top_right = origin(1, 2)
-        else:
-            top_right = origin(1, 2).end('right')
+            i = _last_index([r[0] for r in values], at_bottom)
+            if i is None:
+                last_row = sheet.range((row + 1, column)).end('down').row
+            else:
+                last_row = row + i
 
-        return Range(top_right, bottom_left)
+            j = _last_index(values[0], at_right)
+            if j is None:
+                last_column = sheet.range((row, column + 1)).end('right').column
+            else:
+                last_column = column + j
+
+        return sheet.range((row, column, last_row - row + 1, last_column - column + 1))
 
 
 TableExpander().register('table')
@@ -60,13 +109,16 @@ TableExpander().register('table')
 class VerticalExpander(Expander):
 
     def expand(self, rng):
-        if rng(2, 1).raw_value in _empty:
-            return Range(rng(1, 1), rng(1, rng.shape[1]))
-        elif rng(3, 1).raw_value in _empty:
-            return Range(rng(1, 1), rng(2, rng.shape[1]))
+        sheet = rng.sheet
+        row, column = rng.row, rng.column
+        values, at_bottom, _ = _probe(sheet, row, column, _PROBE_SIZE, 1)
+
+        i = _last_index([r[0] for r in values], at_bottom)
+        if i is None:
+            nrows = sheet.range((row + 1, column)).end('down').row - row + 1
         else:
-            end_row = rng(2, 1).end('down').row - rng.row + 1
-            return Range(rng(1, 1), rng(end_row, rng.shape[1]))
+            nrows = i + 1
+        return sheet.range((row, column, nrows, rng.shape[1]))
 
 
 VerticalExpander().register('vertical', 'down', 'd')
@@ -75,13 +127,16 @@ VerticalExpander().register('vertical', 'down', 'd')
 class HorizontalExpander(Expander):
 
     def expand(self, rng):
-        if rng(1, 2).raw_value in _empty:
-            return Range(rng(1, 1), rng(rng.shape[0], 1))
-        elif rng(1, 3).raw_value in _empty:
-            return Range(rng(1, 1), rng(rng.shape[0], 2))
+        sheet = rng.sheet
+        row, column = rng.row, rng.column
+        values, _, at_right = _probe(sheet, row, column, 1, _PROBE_SIZE)
+
+        j = _last_index(values[0], at_right)
+        if j is None:
+            ncols = sheet.range((row, column + 1)).end('right').column - column + 1
         else:
-            end_column = rng(1, 2).end('right').column - rng.column + 1
-        return Range(rng(1, 1), rng(rng.shape[0], end_column))
+            ncols = j + 1
+        return sheet.range((row, column, rng.shape[0], ncols))
 
 
 HorizontalExpander().register('horizontal', 'right', 'r')
@@ -11,31 +11,33 @@ License: BSD 3-clause (see LICENSE.txt for details)
 import os
 import sys
 import re
-import numbers
+import types
 import subprocess
 from pathlib import Path
 from contextlib import contextmanager
+from itertools import islice
 
 from . import xlplatform, ShapeAlreadyExists, utils, XlwingsError
 import xlwings
 
 # Optional imports
-try:
-    import matplotlib as mpl
-    from matplotlib.backends.backend_agg import FigureCanvas
-except ImportError:
-    mpl = None
-    FigureCanvas = None
-
 try:
     import pandas as pd
 except ImportError:
     pd = None
 
-try:
-    import PIL
-except ImportError:
-    PIL = None
+# Extracts the URL from a formula like =HYPERLINK("http://www.xlwings.org", "xlwings")
+_HYPERLINK_RE = re.compile(r'"([^"]+)"')
+
+# Shared by all Ranges without options. Read-only, so it can't be changed by accident via one of them
+_EMPTY_OPTIONS = types.MappingProxyType({})
+
+# Keys that the collections treat as (0-based) index rather than name. Concrete types are used instead of the
+# numbers.Number ABC as isinstance() is a lot faster with them. NumPy numbers are included as they used to work, too
+_index_types = (int, float) if utils.np is None else (int, float, utils.np.number)
+
+# Book.caller() impls when called from Excel, keyed by sys.argv (which is the same for the lifetime of the process)
+_caller_impls = {}
 
 
 class Collection:
@@ -68,13 +70,11 @@ class Collection:
             yield self._wrap(impl=impl)
 
     def __getitem__(self, key):
-        if isinstance(key, numbers.Number):
+        if isinstance(key, _index_types):
             l = len(self)
-            if key >= l:
+            if not -l <= key < l:
                 raise IndexError("Index %s out of range (%s elements)" % (key, l))
             if key < 0:
-                if key < -l:
-                    raise IndexError("Index %s out of range (%s elements)" % (key, l))
                 key += l
             return self(key + 1)
         elif isinstance(key, slice):
@@ -91,13 +91,11 @@ class Collection:
         return self.__class__.__name__
 
     def __repr__(self):
-        r = []
-        for i, x in enumerate(self):
-            if i == 3:
-                r.append("...")
-                break
-            else:
-                r.append(repr(x))
+        # The 4th item is only fetched to know whether there are more
+        items = list(islice(self, 4))
+        r = [repr(x) for x in items[:3]]
+        if len(items) > 3:
+            r.append("...")
 
         return '{}({})'.format(
             self._name,
@@ -223,7 +221,9 @@ class App:
             self.impl = impl
             if visible:
                 self.visible = True
-        self._pid = self.pid
+        # PID and version don't change over the lifetime of an Excel instance, so they are only read once
+        self._pid = self.impl.pid
+        self._version = None
 
     @property
     def api(self):
@@ -249,7 +249,9 @@ class App:
 
         .. versionchanged:: 0.9.0
         """
-        return utils.VersionNumber(self.impl.version)
+        if self._version is None:
+            self._version = utils.VersionNumber(self.impl.version)
+        return self._version
 
     @property
     def selection(self):
@@ -427,7 +429,7 @@ class App:
 
         .. versionadded:: 0.9.0
         """
-        return self.impl.pid
+        return self._pid
 
     def range(self, cell1, cell2=None):
         """
@@ -596,6 +598,13 @@ class App:
                 pass
 
 
+def _enumerate_books(app):
+    # Yields (fullname, name, impl) for every book of the app: works directly on the engine's
+    # collection so that each property is read exactly once and no Book wrappers are built
+    for impl in app.impl.books:
+        yield impl.fullname, impl.name, impl
+
+
 class Book:
     """
     A book object is a member of the :meth:`books <xlwings.main.Books>` collection:
@@ -667,13 +676,18 @@ class Book:
         if not impl:
             if fullname:
                 fullname = utils.fspath(fullname)
-                fullname = fullname.lower()
+                # Only the lookup is case-insensitive: opening the file requires the original path
+                # as the file system may be case-sensitive
+                normalized_fullname = fullname.lower()
 
-                candidates = []
+                # Index all open books by their normalized fullname and name (both are identical for
+                # unsaved books, hence the set) so that finding the book is a single dict lookup
+                index = {}
                 for app in apps:
-                    for wb in app.books:
-                        if wb.fullname.lower() == fullname or wb.name.lower() == fullname:
-                            candidates.append((app, wb))
+                    for wb_fullname, wb_name, wb_impl in _enumerate_books(app):
+                        for key in {wb_fullname.lower(), wb_name.lower()}:
+                            index.setdefault(key, []).append((app, wb_impl))
+                candidates = index.get(normalized_fullname, [])
 
                 app = apps.active
                 if len(candidates) == 0:
@@ -685,7 +699,7 @@ class Book:
                 elif len(candidates) > 1:
                     raise Exception("Workbook '%s' is open in more than one Excel instance." % fullname)
                 else:
-                    impl = candidates[0][1].impl
+                    impl = candidates[0][1]
             else:
                 # Open Excel if necessary and create a new workbook
                 if apps.active:
@@ -742,15 +756,20 @@ class Book:
             # Use mocking Book, see Book.set_mock_caller()
             return cls(impl=Book._mock_caller.impl)
         elif from_xl == '1':
-            name = wb.lower()
-            if sys.platform.startswith('win'):
-                app = App(impl=xlplatform.App(xl=int(hwnd)))
-                return cls(impl=app.books[name].impl)
-            else:
-                # On Mac, the same file open in two instances is not supported
-                if apps.active.version < 15:
-                    name = name.encode('utf-8', 'surrogateescape').decode('mac_latin2')
-                return cls(impl=Book(name).impl)
+            key = tuple(sys.argv)
+            impl = _caller_impls.get(key)
+            if impl is None:
+                name = wb.lower()
+                if sys.platform.startswith('win'):
+                    app = App(impl=xlplatform.App(xl=int(hwnd)))
+                    impl = app.books[name].impl
+                else:
+                    # On Mac, the same file open in two instances is not supported
+                    if apps.active.version < 15:
+                        name = name.encode('utf-8', 'surrogateescape').decode('mac_latin2')
+                    impl = Book(name).impl
+                _caller_impls[key] = impl
+            return cls(impl=impl)
         elif xlplatform.BOOK_CALLER:
             # Called via OPTIMIZED_CONNECTION = True
             return cls(impl=xlplatform.Book(xlplatform.BOOK_CALLER))
@@ -847,6 +866,7 @@ class Book:
         .. versionadded:: 0.1.1
         """
         self.impl.close()
+        _caller_impls.clear()
 
     def save(self, path=None):
         """
@@ -1387,6 +1407,40 @@ class Sheet:
         return "<Sheet [{1}]{0}>".format(self.name, self.book.name)
 
 
+def _normalize_index(key, n, axis):
+    # Returns the first and last (0-based) index of a row or column key, which is either an int or a slice.
+    # Ordered by frequency: single cells, then full rows/columns as used by RangeRows/RangeColumns
+    if isinstance(key, int):
+        if key < 0:
+            key += n
+        if key < 0 or key >= n:
+            raise IndexError("%s index %s out of range (%s %ss)." % (axis, key, n, axis.lower()))
+        return key, key
+    elif isinstance(key, slice):
+        if key.start is None and key.stop is None and key.step is None:
+            return 0, n - 1
+        first, stop, step = key.indices(n)
+        if step != 1:
+            raise ValueError("Slice steps not supported.")
+        return first, stop - 1
+    else:
+        raise TypeError("%s indices must be integers or slices, not %s" % (axis, type(key).__name__))
+
+
+def _range_impl_from_ranges(cell1, cell2):
+    if cell1.sheet != cell2.sheet:
+        raise ValueError("Ranges are not on the same sheet")
+    return cell1.sheet.range(cell1, cell2).impl
+
+
+def _range_impl_from_address(cell1, cell2):
+    return apps.active.range(cell1).impl
+
+
+def _range_impl_from_tuples(cell1, cell2):
+    return sheets.active.range(cell1, cell2).impl
+
+
 class Range:
     """
     Returns a Range object that represents a cell or a range of cells.
@@ -1422,28 +1476,28 @@ class Range:
         xw.books['MyBook.xlsx'].sheets[0].range('A1')
     """
 
+    __slots__ = ['_impl', '_options']
+
     def __init__(self, cell1=None, cell2=None, **options):
 
         # Arguments
         impl = options.pop('impl', None)
         if impl is None:
-            if cell2 is not None and isinstance(cell1, Range) and isinstance(cell2, Range):
-                if cell1.sheet != cell2.sheet:
-                    raise ValueError("Ranges are not on the same sheet")
-                impl = cell1.sheet.range(cell1, cell2).impl
-            elif cell2 is None and isinstance(cell1, str):
-                impl = apps.active.range(cell1).impl
-            elif cell2 is None and isinstance(cell1, tuple):
-                impl = sheets.active.range(cell1, cell2).impl
-            elif cell2 is not None and isinstance(cell1, tuple) and isinstance(cell2, tuple):
-                impl = sheets.active.range(cell1, cell2).impl
-            else:
-                raise ValueError("Invalid arguments")
+            handler = _range_impl_handlers.get((type(cell1), type(cell2)))
+            if handler is None:
+                # Subclasses, e.g. of str or tuple
+                for (type1, type2), f in _range_impl_handlers.items():
+                    if isinstance(cell1, type1) and isinstance(cell2, type2):
+                        handler = f
+                        break
+                else:
+                    raise ValueError("Invalid arguments")
+            impl = handler(cell1, cell2)
 
         self._impl = impl
 
         # Keyword Arguments
-        self._options = options
+        self._options = options or _EMPTY_OPTIONS
 
     @property
     def impl(self):
@@ -1475,8 +1529,12 @@ class Range:
 
     def __iter__(self):
         # Iterator object that returns cell Ranges: (1, 1), (1, 2) etc.
-        for i in range(len(self)):
-            yield self(i + 1)
+        # Row and column are passed to the engine's item access directly, so nothing has to be
+        # recomputed from a linear index for every cell
+        nrows, ncols = self.shape
+        for r in range(1, nrows + 1):
+            for c in range(1, ncols + 1):
+                yield self(r, c)
 
     def options(self, convert=None, **options):
         """
@@ -1843,12 +1901,15 @@ class Range:
 
         if include_sheetname and not external:
             # TODO: when the Workbook name contains spaces but not the Worksheet name, it will still be surrounded
-            # by '' when include_sheetname=True. Also, should probably changed to regex
+            # by '' when include_sheetname=True
             temp_str = self.impl.get_address(row_absolute, column_absolute, True)
 
-            if temp_str.find("[") > -1:
-                results_address = temp_str[temp_str.rfind("]") + 1:]
-                if results_address.find("'") > -1:
+            # e.g. '[Book 1.xlsx]Sheet1'!$A$1: sheet names can't contain brackets, so the last "]" ends the book name
+            # and the address is quoted if and only if the whole string is
+            bracket_close = temp_str.rfind("]")
+            if bracket_close > -1:
+                results_address = temp_str[bracket_close + 1:]
+                if temp_str.startswith("'"):
                     results_address = "'" + results_address
                 return results_address
             else:
@@ -1994,7 +2055,8 @@ class Range:
 
     @value.setter
     def value(self, data):
-        conversion.write(data, self, self._options)
+        # Converters may add to the options (e.g. the header of a pd.Series), which the shared empty options don't allow
+        conversion.write(data, self, self._options or {})
 
     def expand(self, mode='table'):
         """
@@ -2025,38 +2087,11 @@ class Range:
         return expansion.expanders.get(mode, mode).expand(self)
 
     def __getitem__(self, key):
+        nrows, ncols = self.shape
         if type(key) is tuple:
             row, col = key
-
-            n = self.shape[0]
-            if isinstance(row, slice):
-                row1, row2, step = row.indices(n)
-                if step != 1:
-                    raise ValueError("Slice steps not supported.")
-                row2 -= 1
-            elif isinstance(row, int):
-                if row < 0:
-                    row += n
-                if row < 0 or row >= n:
-                    raise IndexError("Row index %s out of range (%s rows)." % (row, n))
-                row1 = row2 = row
-            else:
-                raise TypeError("Row indices must be integers or slices, not %s" % type(row).__name__)
-
-            n = self.shape[1]
-            if isinstance(col, slice):
-                col1, col2, step = col.indices(n)
-                if step != 1:
-                    raise ValueError("Slice steps not supported.")
-                col2 -= 1
-            elif isinstance(col, int):
-                if col < 0:
-                    col += n
-                if col < 0 or col >= n:
-                    raise IndexError("Column index %s out of range (%s columns)." % (col, n))
-                col1 = col2 = col
-            else:
-                raise TypeError("Column indices must be integers or slices, not %s" % type(col).__name__)
+            row1, row2 = _normalize_index(row, nrows, 'Row')
+            col1, col2 = _normalize_index(col, ncols, 'Column')
 
             return self.sheet.range((
                 self.row + row1,
@@ -2066,16 +2101,16 @@ class Range:
             ))
 
         elif isinstance(key, slice):
-            if self.shape[0] > 1 and self.shape[1] > 1:
+            if nrows > 1 and ncols > 1:
                 raise IndexError("One-dimensional slicing is not allowed on two-dimensional ranges")
 
-            if self.shape[0] > 1:
+            if nrows > 1:
                 return self[key, :]
             else:
                 return self[:, key]
 
         elif isinstance(key, int):
-            n = len(self)
+            n = nrows * ncols
             k = key + n if key < 0 else key
             if k < 0 or k >= n:
                 raise IndexError("Index %s out of range (%s elements)." % (key, n))
@@ -2178,11 +2213,11 @@ class Range:
 
         .. versionadded:: 0.3.0
         """
-        if self.formula.lower().startswith('='):
+        formula = self.formula
+        if formula.startswith('='):
             # If it's a formula, extract the URL from the formula string
-            formula = self.formula
             try:
-                return re.compile(r'\"(.+?)\"').search(formula).group(1)
+                return _HYPERLINK_RE.search(formula).group(1)
             except AttributeError:
                 raise Exception("The cell doesn't seem to contain a hyperlink!")
         else:
@@ -2242,7 +2277,7 @@ class Range:
         else:
             column_size = self.shape[1]
 
-        return Range(self(1, 1), self(row_size, column_size)).options(**self._options)
+        return self._from_coords(self.row, self.column, row_size, column_size)
 
     def offset(self, row_offset=0, column_offset=0):
         """
@@ -2255,16 +2290,8 @@ class Range:
 
         .. versionadded:: 0.3.0
         """
-        return Range(
-            self(
-                row_offset + 1,
-                column_offset + 1
-            ),
-            self(
-                row_offset + self.shape[0],
-                column_offset + self.shape[1]
-            )
-        ).options(**self._options)
+        nrows, ncols = self.shape
+        return self._from_coords(self.row + row_offset, self.column + column_offset, nrows, ncols)
 
     @property
     def last_cell(self):
@@ -2285,7 +2312,13 @@ class Range:
 
         .. versionadded:: 0.3.5
         """
-        return self(self.shape[0], self.shape[1]).options(**self._options)
+        nrows, ncols = self.shape
+        return self._from_coords(self.row + nrows - 1, self.column + ncols - 1, 1, 1)
+
+    def _from_coords(self, row, column, nrows, ncols):
+        # Returns a Range with the same options on the same sheet. As it's built from coordinates, it doesn't
+        # require any calls to the engine until it is used.
+        return Range(impl=self.sheet.impl.range((row, column, nrows, ncols)), **self._options)
 
     def select(self):
         """
@@ -2393,7 +2426,9 @@ class Range:
 
         .. versionadded:: 0.24.8
         """
-        if not PIL:
+        try:
+            import PIL
+        except ImportError:
             raise XlwingsError('Range.to_png() requires an installation of Pillow.')
         path = utils.fspath(path)
         if path is None:
@@ -2408,6 +2443,15 @@ class Range:
         self.impl.to_png(path)
 
 
+# Range() arguments by (type(cell1), type(cell2))
+_range_impl_handlers = {
+    (str, type(None)): _range_impl_from_address,
+    (tuple, type(None)): _range_impl_from_tuples,
+    (tuple, tuple): _range_impl_from_tuples,
+    (Range, Range): _range_impl_from_ranges,
+}
+
+
 # These have to be after definition of Range to resolve circular reference
 from . import conversion
 from . import expansion
@@ -2559,11 +2603,12 @@ class Shape:
     .. versionchanged:: 0.9.0
     """
 
-    def __init__(self, *args, **options):
-        impl = options.pop('impl', None)
+    __slots__ = ['impl']
+
+    def __init__(self, *args, impl=None):
         if impl is None:
             if len(args) == 1:
-                impl = sheets.active.shapes(args[0]).impl
+                impl = sheets.active.impl.shapes(args[0])
 
             else:
                 raise ValueError("Invalid arguments")
@@ -2871,8 +2916,7 @@ class Table:
     .. versionadded:: 0.21.0
     """
 
-    def __init__(self, *args, **options):
-        impl = options.pop('impl', None)
+    def __init__(self, *args, impl=None):
         if impl is None:
             if len(args) == 1:
                 impl = sheets.active.tables(args[0]).impl
@@ -3171,13 +3215,17 @@ class Chart:
     <Chart 'Chart 1' in <Sheet [Book1]Sheet1>>
     """
 
+    __slots__ = ['impl', '_parent']
+
     def __init__(self, name_or_index=None, impl=None):
         if impl is not None:
             self.impl = impl
         elif name_or_index is not None:
-            self.impl = sheets.active.charts(name_or_index).impl
+            self.impl = sheets.active.impl.charts(name_or_index)
         else:
             self.impl = sheets.active.charts.add().impl
+        # A chart stays on the sheet (or in the book, for chart sheets) it was created on
+        self._parent = None
 
     @property
     def api(self):
@@ -3206,11 +3254,13 @@ class Chart:
 
         .. versionadded:: 0.9.0
         """
-        impl = self.impl.parent
-        if isinstance(impl, xlplatform.Book):
-            return Book(impl=self.impl.parent)
-        else:
-            return Sheet(impl=self.impl.parent)
+        if self._parent is None:
+            impl = self.impl.parent
+            if isinstance(impl, xlplatform.Book):
+                self._parent = Book(impl=impl)
+            else:
+                self._parent = Sheet(impl=impl)
+        return self._parent
 
     @property
     def chart_type(self):
@@ -3461,6 +3511,8 @@ class Picture:
     .. versionchanged:: 0.9.0
     """
 
+    __slots__ = ['impl']
+
     def __init__(self, impl=None):
         self.impl = impl
 
@@ -3731,7 +3783,8 @@ class Pictures(Collection):
                 raise ValueError("You must either provide 'anchor' or 'top'/'left', but not both.")
             top, left = anchor.top, anchor.left
 
-        if (height and width is None) or (width and height is None) or (width is None and height is None):
+        only_one_dimension = bool((height and width is None) or (width and height is None))
+        if only_one_dimension or (width is None and height is None):
             # If only height or width are provided, it will be scaled after adding it with the original dimensions
             im_width, im_height = -1, -1
         else:
@@ -3742,7 +3795,7 @@ class Pictures(Collection):
             width=im_width, height=im_height
         ))
 
-        if (height and width is None) or (width and height is None):
+        if only_one_dimension:
             # If only height or width are provided, lock aspect ratio so the picture won't be distorted
             picture.lock_aspect_ratio = True
             if height:
@@ -3751,8 +3804,9 @@ class Pictures(Collection):
                 picture.width = width
 
         if scale:
-            self.parent.shapes[picture.name].scale_width(factor=scale, relative_to_original_size=True)
-            self.parent.shapes[picture.name].scale_height(factor=scale, relative_to_original_size=True)
+            shape = self.parent.shapes[picture.name]
+            shape.scale_width(factor=scale, relative_to_original_size=True)
+            shape.scale_height(factor=scale, relative_to_original_size=True)
 
         if name is not None:
             picture.name = name
@@ -3828,7 +3882,7 @@ class Names:
         return Name(impl=self.impl.add(name, refers_to))
 
     def __getitem__(self, item):
-        if isinstance(item, numbers.Number):
+        if isinstance(item, _index_types):
             return self(item + 1)
         else:
             return self(item)
@@ -3842,29 +3896,31 @@ class Names:
             self.add(key, value)
 
     def __contains__(self, item):
-        if isinstance(item, numbers.Number):
+        if isinstance(item, _index_types):
             return 0 <= item < len(self)
         else:
             return self.contains(item)
 
     def __delitem__(self, key):
-        if key in self:
-            self[key].delete()
+        # Indices are checked against the count, names with a single lookup instead of __contains__ first
+        if isinstance(key, _index_types):
+            impl = self.impl.get(key + 1) if 0 <= key < len(self) else None
         else:
+            impl = self.impl.get(key)
+        if impl is None:
             raise KeyError(key)
+        impl.delete()
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self(i + 1)
+        for impl in self.impl:
+            yield Name(impl=impl)
 
     def __repr__(self):
-        r = []
-        for i, n in enumerate(self):
-            if i == 3:
-                r.append("...")
-                break
-            else:
-                r.append(repr(n))
+        # The 4th item is only fetched to know whether there are more
+        items = list(islice(self, 4))
+        r = [repr(n) for n in items[:3]]
+        if len(items) > 3:
+            r.append("...")
         return "[" + ", ".join(r) + "]"
 
 
@@ -3880,6 +3936,8 @@ class Name:
     .. versionadded:: 0.9.0
     """
 
+    __slots__ = ['impl']
+
     def __init__(self, impl):
         self.impl = impl
 
@@ -3984,15 +4042,22 @@ def view(obj, sheet=None, table=True, chunksize=5000):
     app = sheet.book.app
     app.activate(steal_focus=True)
 
+    # A1, from its coordinates instead of an address that would have to be parsed
+    origin = sheet.range((1, 1))
+
     with app.properties(screen_updating=False):
         if pd and isinstance(obj, pd.DataFrame):
             if table:
-                sheet['A1'].options(assign_empty_index_names=True, chunksize=chunksize).value = obj
-                sheet.tables.add(sheet['A1'].expand())
+                origin.options(assign_empty_index_names=True, chunksize=chunksize).value = obj
+                # The table covers the header row(s), index column(s) and data that were just written. Other than
+                # expand(), this doesn't have to probe the sheet and isn't cut short by an empty row or column
+                nrows = obj.columns.nlevels + len(obj)
+                ncols = obj.index.nlevels + len(obj.columns)
+                sheet.tables.add(sheet.range((1, 1, nrows, ncols)))
             else:
-                sheet['A1'].options(assign_empty_index_names=False, chunksize=chunksize).value = obj
+                origin.options(assign_empty_index_names=False, chunksize=chunksize).value = obj
         else:
-            sheet['A1'].value = obj
+            origin.value = obj
         sheet.autofit()
 
 
@@ -4037,17 +4102,18 @@ def load(index=1, header=1, chunksize=5000):
 
 
 class Macro:
+    __slots__ = ['app', 'macro']
+
     def __init__(self, app, macro):
         self.app = app
         self.macro = macro
 
-    def run(self, *args):
-        args = [i.api
-                if isinstance(i, (App, Book, Sheet, Range, Shape, Chart, Picture, Name))
-                else i for i in args]
+    def __call__(self, *args):
+        xlwings_types = (App, Book, Sheet, Range, Shape, Chart, Picture, Name)
+        args = [i.api if isinstance(i, xlwings_types) else i for i in args]
         return self.app.impl.run(self.macro, args)
 
-    __call__ = run
+    run = __call__
 
 
 class Characters:
@@ -4315,6 +4381,13 @@ class Sheets(Collection):
     def __delitem__(self, name_or_index):
         self[name_or_index].delete()
 
+    def _to_sheet(self, sheet):
+        # None and Sheets (the common case, checked without walking the MRO) are returned as they are, anything else
+        # is looked up by name or index. Subclasses of Sheet are returned by __call__
+        if sheet is None or type(sheet) is Sheet:
+            return sheet
+        return self(sheet)
+
     def add(self, name=None, before=None, after=None):
         """
         Creates a new Sheet and makes it the active sheet.
@@ -4335,15 +4408,50 @@ class Sheets(Collection):
         if name is not None:
             if name.lower() in (s.name.lower() for s in self):
                 raise ValueError("Sheet named '%s' already present in workbook" % name)
-        if before is not None and not isinstance(before, Sheet):
-            before = self(before)
-        if after is not None and not isinstance(after, Sheet):
-            after = self(after)
+        before, after = self._to_sheet(before), self._to_sheet(after)
         impl = self.impl.add(before and before.impl, after and after.impl)
         if name is not None:
             impl.name = name
         return Sheet(impl=impl)
 
+    def add_many(self, names, before=None, after=None):
+        """
+        Creates a new Sheet for each name, keeping the order of the names. Unlike calling ``add()`` in a loop,
+        the names of the existing sheets are only read once.
+
+        Parameters
+        ----------
+        names : iterable of str
+            Names of the new sheets.
+        before : Sheet, default None
+            An object that specifies the sheet before which the new sheets are added.
+        after : Sheet, default None
+            An object that specifies the sheet after which the new sheets are added.
+
+        Returns
+        -------
+        list of Sheets
+
+        .. versionadded:: 0.24.10
+        """
+        names = list(names)
+        # Validate all names before adding anything so that a clash doesn't leave half of the sheets behind
+        taken_names = {s.name.lower() for s in self}
+        for name in names:
+            if name.lower() in taken_names:
+                raise ValueError("Sheet named '%s' already present in workbook" % name)
+            taken_names.add(name.lower())
+
+        before, after = self._to_sheet(before), self._to_sheet(after)
+        new_sheets = []
+        for name in names:
+            impl = self.impl.add(before and before.impl, after and after.impl)
+            impl.name = name
+            new_sheets.append(Sheet(impl=impl))
+            # The next sheet goes right after this one
+            before, after = None, new_sheets[-1]
+        return new_sheets
+
 
 class ActiveAppBooks(Books):
 
@@ -4355,7 +4463,8 @@ class ActiveAppBooks(Books):
 
     @property
     def impl(self):
-        return apps.active.books.impl
+        # Goes straight through the engine objects instead of wrapping and unwrapping App and Books
+        return apps.active.impl.books
 
 
 class ActiveBookSheets(Sheets):
@@ -4368,7 +4477,7 @@ class ActiveBookSheets(Sheets):
 
     @property
     def impl(self):
-        return books.active.sheets.impl
+        return books.impl.active.sheets
 
 
 books = ActiveAppBooks()
@@ -13,18 +13,6 @@ try:
 except ImportError:
     np = None
 
-try:
-    import matplotlib as mpl
-    import matplotlib.pyplot as plt
-    import matplotlib.figure
-except ImportError:
-    mpl = None
-
-try:
-    import plotly.graph_objects as plotly_go
-except ImportError:
-    plotly_go = None
-
 import xlwings
 
 missing = object()
@@ -204,14 +192,26 @@ class VersionNumber:
             raise TypeError("Cannot compare other object with version number")
 
 
+def _is_mpl_figure(image):
+    import matplotlib.figure
+    return isinstance(image, matplotlib.figure.Figure)
+
+
+def _is_plotly_figure(image):
+    import plotly.graph_objects as plotly_go
+    return isinstance(image, plotly_go.Figure)
+
+
 def process_image(image, format):
     """Returns filename and is_temp_file"""
     image = fspath(image)
     if isinstance(image, str):
         return image, False
-    elif mpl and isinstance(image, mpl.figure.Figure):
+    # Matplotlib and Plotly are slow to import and are therefore only imported here. If they haven't been
+    # imported by the caller, the image can't be one of their figures.
+    elif 'matplotlib' in sys.modules and _is_mpl_figure(image):
         image_type = 'mpl'
-    elif plotly_go and isinstance(image, plotly_go.Figure):
+    elif 'plotly' in sys.modules and _is_plotly_figure(image):
         image_type = 'plotly'
     else:
         raise TypeError("Don't know what to do with that image object")
@@ -226,8 +226,12 @@ def process_image(image, format):
     filename = os.path.join(temp_dir, str(uuid.uuid4()) + '.' + format)
 
     if image_type == 'mpl':
-        canvas = mpl.backends.backend_agg.FigureCanvas(image)
-        canvas.draw()
+        import matplotlib.pyplot as plt
+        if image.canvas is None:
+            # Figures created without pyplot don't have a canvas with older versions of Matplotlib. There's no need
+            # to draw it though: savefig() renders the figure itself
+            from matplotlib.backends.backend_agg import FigureCanvas
+            FigureCanvas(image)
         image.savefig(filename, bbox_inches='tight', dpi=300)
         plt.close(image)
     elif image_type == 'plotly':
@@ -236,13 +240,8 @@ def process_image(image, format):
 
 
 def fspath(path):
-    """Convert path-like object to string.
-
-    On python <= 3.5 the input argument is always returned unchanged (no support for path-like
-    objects available).
-
-    """
-    if hasattr(os, 'PathLike') and isinstance(path, os.PathLike):
+    """Convert path-like object to string."""
+    if isinstance(path, os.PathLike):
         return os.fspath(path)
     else:
         return path